@@ -5,14 +5,25 @@ Simple in‑memory banking system with CSV persistence.
 from __future__ import annotations
 
 import csv
+import threading
 import uuid
+from contextlib import ExitStack
 from dataclasses import dataclass, field
 from decimal import Decimal
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict
+from sys import intern
+from typing import Dict, Final, Iterable, Mapping
 
+# shared zero; Decimals are immutable so one instance is safe to reuse
+_ZERO: Final[Decimal] = Decimal("0.00")
+# quantization target for money amounts
+_CENTS: Final[Decimal] = Decimal("0.01")
+# buffer size for CSV persistence (1 MiB)
+_IO_BUFFER: Final[int] = 1 << 20
 
-@dataclass
+
+@dataclass(slots=True)
 class BankAccount:
     """Represents a single customer account.
 
@@ -29,7 +40,7 @@ class BankAccount:
     id: str
     name: str
     # use decimal instead float for perfect precision
-    balance: Decimal = field(default=Decimal("0.00"))
+    balance: Decimal = field(default=_ZERO)
 
     # ── public API ──────────────────────────────────────────────────────────
     def deposit(self, amount: Decimal) -> None:
@@ -45,7 +56,7 @@ class BankAccount:
         ValueError
             If *amount* is not strictly positive.
         """
-        if amount <= 0:
+        if amount <= _ZERO:
             raise ValueError("amount must be positive")
         self.balance += amount
 
@@ -54,7 +65,7 @@ class BankAccount:
 
         Prevents overdrafts by raising ValueError if insufficient funds.
         """
-        if amount <= 0:
+        if amount <= _ZERO:
             raise ValueError("amount must be positive")
         if amount > self.balance:
             raise ValueError("insufficient funds")
@@ -65,8 +76,10 @@ class BankingSystem:
     """A banking system managing many `BankAccount`s"""
 
     def __init__(self) -> None:
-        # internal store keyed by account id
+        # internal store keyed by account id (32-char uuid4 hex)
         self._accounts: Dict[str, BankAccount] = {}
+        # per-account locks held while changing a balance, keyed like _accounts
+        self._locks: Dict[str, threading.Lock] = {}
 
     # ── account creation ────────────────────────────────────────────────────
     def create_account(self, name: str, opening_balance: float = 0.0) -> str:
@@ -75,7 +88,8 @@ class BankingSystem:
         """
         if opening_balance < 0:
             raise ValueError("amount must be positive")
-        acc_id = str(uuid.uuid4())
+        acc_id = uuid.uuid4().hex
+        self._locks[acc_id] = threading.Lock()
         self._accounts[acc_id] = BankAccount(
             id=acc_id, name=name, balance=to_decimal(opening_balance)
         )
@@ -86,22 +100,64 @@ class BankingSystem:
         """
         Deposit *amount* into *acc_id*.
         """
-        self._accounts[acc_id].deposit(to_decimal(amount))
+        acc = self._accounts[acc_id]
+        with self._locks[acc_id]:
+            acc.deposit(to_decimal(amount))
 
     def withdraw(self, acc_id: str, amount: float) -> None:
         """
         Withdraw *amount* from *acc_id*.
         """
-        self._accounts[acc_id].withdraw(to_decimal(amount))
+        acc = self._accounts[acc_id]
+        with self._locks[acc_id]:
+            acc.withdraw(to_decimal(amount))
 
     def transfer(self, src_id: str, dst_id: str, amount: float) -> None:
         """Move funds from *src_id* to *dst_id*.
 
         Uses *withdraw* / *deposit* to ensure the usual validations apply.
+        Both accounts are looked up before any balance changes, so an unknown
+        id raises KeyError without debiting *src_id*. Both account locks are
+        held for the whole move, so concurrent transfers never interleave.
         """
         amt = to_decimal(amount)
-        self._accounts[src_id].withdraw(amt)
-        self._accounts[dst_id].deposit(amt)
+        accounts = self._accounts
+        src = accounts[src_id]
+        dst = accounts[dst_id]
+        with self._lock_all((src_id, dst_id)):
+            src.withdraw(amt)
+            dst.deposit(amt)
+
+    def bulk_deposit(self, amounts: Mapping[str, float]) -> None:
+        """Deposit ``amounts[acc_id]`` into every *acc_id* in *amounts*.
+
+        All ids and amounts are validated before any balance changes, so the
+        batch is applied either completely or not at all.
+        """
+        accounts = self._accounts
+        credits = [
+            (accounts[acc_id], to_decimal(amt)) for acc_id, amt in amounts.items()
+        ]
+        if any(amt <= _ZERO for _, amt in credits):
+            raise ValueError("amount must be positive")
+        with self._lock_all(amounts):
+            for acc, amt in credits:
+                acc.deposit(amt)
+
+    def _lock_all(self, acc_ids: Iterable[str]) -> ExitStack:
+        """
+        Acquire the locks of *acc_ids* in id order and return a stack releasing
+        them.
+
+        A single global order means two threads locking overlapping sets can
+        never deadlock; an id listed twice is only locked once.
+        """
+        locks = self._locks
+        # if a later acquire raises, the with block releases the earlier ones
+        with ExitStack() as stack:
+            for acc_id in sorted(set(acc_ids)):
+                stack.enter_context(locks[acc_id])
+            return stack.pop_all()
 
     # ── balance queries ─────────────────────────────────────────────────────────────
     def get_balance(self, acc_id: str) -> Decimal:
@@ -115,11 +171,29 @@ class BankingSystem:
         """
         Serialize all accounts to *path* in CSV format.
         """
-        with Path(path).open("w", newline="") as f:
+        accounts = self._accounts
+        # ids are hex and balances Decimals, so normally nothing needs quoting
+        # and rows are joined directly and handed to the OS in a single write;
+        # "\r\n" matches csv.writer's default line terminator
+        rows = "".join(
+            [f"{acc.id},{acc.name},{acc.balance}\r\n" for acc in accounts.values()]
+        )
+        n = len(accounts)
+        if (
+            rows.count(",") == 2 * n
+            and rows.count("\n") == n
+            and rows.count("\r") == n
+            and '"' not in rows
+        ):
+            Path(path).write_bytes(f"id,name,balance\r\n{rows}".encode("utf-8"))
+            return
+        # some name contains a comma, quote or line break and needs quoting
+        with Path(path).open(
+            "w", newline="", encoding="utf-8", buffering=_IO_BUFFER
+        ) as f:
             w = csv.writer(f)
             w.writerow(("id", "name", "balance"))
-            for acc in self._accounts.values():
-                w.writerow((acc.id, acc.name, str(acc.balance)))
+            w.writerows((acc.id, acc.name, acc.balance) for acc in accounts.values())
 
     @classmethod
     def load_csv(cls, path: str | Path = "accounts.csv") -> "BankingSystem":
@@ -133,18 +207,32 @@ class BankingSystem:
         p = Path(path)
         if not p.exists():
             return sys
-        with p.open() as f:
-            for row in csv.DictReader(f):
-                sys._accounts[row["id"]] = BankAccount(
-                    id=row["id"],
-                    name=row["name"],
-                    balance=Decimal(row["balance"]),
+        with p.open(newline="", encoding="utf-8", buffering=_IO_BUFFER) as f:
+            r = csv.reader(f)
+            next(r, None)  # skip the header row
+            # intern names so holders sharing a name share one str; blank lines
+            # come back as [] and are skipped, as DictReader did
+            sys._accounts = {
+                acc_id: BankAccount(
+                    id=acc_id, name=intern(name), balance=Decimal(balance)
                 )
+                for acc_id, name, balance in filter(None, r)
+            }
+        sys._locks = {acc_id: threading.Lock() for acc_id in sys._accounts}
         return sys
 
 
-def to_decimal(amount: float) -> Decimal:
+# hot amounts (10, 20, 100, ...) repeat a lot; the conversion is pure. typed
+# because equal keys of different types can round differently (2.675 goes
+# through str(), Decimal(2.675) is the exact binary value)
+@lru_cache(maxsize=1024, typed=True)
+def to_decimal(amount: float | int | str | Decimal) -> Decimal:
     """
     Helper function to convert amount to Decimal with 2 digits rounding
     """
-    return Decimal(f"{amount:.2f}")
+    if type(amount) is Decimal:
+        # already at cents (e.g. a get_balance result): no need to quantize
+        if amount.same_quantum(_CENTS):
+            return amount
+        return amount.quantize(_CENTS)
+    return Decimal(str(amount)).quantize(_CENTS)
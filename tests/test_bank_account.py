@@ -2,6 +2,9 @@
 Unit tests dedicated to the `BankAccount` dataclass.
 """
 
+import copy
+import dataclasses
+import pickle
 from decimal import Decimal
 
 import pytest
@@ -15,6 +18,11 @@ def fresh_account():
     return BankAccount(id="acc-1", name="Alice")
 
 
+def test_withdraw_method_name():
+    assert callable(BankAccount.withdraw)
+    assert not hasattr(BankAccount, "withdrawl")
+
+
 def test_initial_balance_zero(fresh_account):
     assert fresh_account.balance == Decimal("0.00")
 
@@ -40,3 +48,14 @@ def test_non_positive_amounts_rejected(fresh_account):
         fresh_account.deposit(Decimal("0.00"))
     with pytest.raises(ValueError):
         fresh_account.withdraw(Decimal("-1.00"))
+
+
+def test_account_can_be_copied_and_pickled(fresh_account):
+    fresh_account.deposit(Decimal("12.50"))
+    assert copy.deepcopy(fresh_account) == fresh_account
+    assert pickle.loads(pickle.dumps(fresh_account)) == fresh_account
+    assert dataclasses.asdict(fresh_account) == {
+        "id": "acc-1",
+        "name": "Alice",
+        "balance": Decimal("12.50"),
+    }
@@ -1,9 +1,37 @@
+import csv
+import threading
 from decimal import Decimal
 from pathlib import Path
 
 import pytest
 
-from banking import BankingSystem
+from banking import BankAccount, BankingSystem, to_decimal
+
+
+def test_to_decimal_rounds_to_cents():
+    assert to_decimal(10) == Decimal("10.00")
+    assert to_decimal(0.125) == Decimal("0.12")
+    assert to_decimal(Decimal("1.005")) == Decimal("1.00")
+
+
+def test_to_decimal_rounds_floats_by_their_repr():
+    # floats round as written (str(2.675) == "2.675"), half to even, not by
+    # their binary value 2.67499999...
+    assert to_decimal(2.675) == Decimal("2.68")
+    assert to_decimal(1.015) == Decimal("1.02")
+
+
+def test_to_decimal_result_does_not_depend_on_call_history():
+    # 2.675 == Decimal(2.675), but they round differently
+    assert to_decimal(2.675) == Decimal("2.68")
+    assert to_decimal(Decimal(2.675)) == Decimal("2.67")
+
+
+def test_to_decimal_keeps_cents_decimal():
+    amount = Decimal("12.34")
+    result = to_decimal(amount)
+    assert result == amount
+    assert result.same_quantum(Decimal("0.01"))
 
 
 def test_create_and_get_balance():
@@ -42,6 +70,88 @@ def test_transfer():
     assert bank.get_balance(b) == Decimal("30.00")
 
 
+def test_transfer_to_unknown_account_leaves_source_untouched():
+    bank = BankingSystem()
+    a = bank.create_account("Dave", 80)
+    with pytest.raises(KeyError):
+        bank.transfer(a, "missing", 30)
+    assert bank.get_balance(a) == Decimal("80.00")
+
+
+def test_concurrent_transfers_cannot_overdraw(monkeypatch):
+    bank = BankingSystem()
+    a = bank.create_account("Dave", 10)
+    b = bank.create_account("Eve")
+    gate = threading.Barrier(2)
+
+    def racy_withdraw(self, amount):
+        # split check and debit and let the other thread run in between;
+        # without locking both transfers pass the check before either debits
+        balance = self.balance
+        if amount > balance:
+            raise ValueError("insufficient funds")
+        try:
+            gate.wait(timeout=0.2)
+        except threading.BrokenBarrierError:
+            pass
+        self.balance = balance - amount
+
+    monkeypatch.setattr(BankAccount, "withdraw", racy_withdraw)
+    failures = []
+
+    def move():
+        try:
+            bank.transfer(a, b, 10)
+        except ValueError:
+            failures.append(True)
+
+    threads = [threading.Thread(target=move) for _ in range(2)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert len(failures) == 1
+    assert bank.get_balance(a) == Decimal("0.00")
+    assert bank.get_balance(b) == Decimal("10.00")
+
+
+def test_lock_all_releases_taken_locks_on_failure():
+    bank = BankingSystem()
+    a = bank.create_account("Dave", 10)
+    with pytest.raises(KeyError):
+        bank._lock_all((a, "missing"))
+    assert not bank._locks[a].locked()
+
+
+def test_transfer_to_self():
+    bank = BankingSystem()
+    a = bank.create_account("Dave", 10)
+    bank.transfer(a, a, 5)
+    assert bank.get_balance(a) == Decimal("10.00")
+
+
+def test_bulk_deposit():
+    bank = BankingSystem()
+    a = bank.create_account("Dave", 10)
+    b = bank.create_account("Eve")
+    bank.bulk_deposit({a: 5, b: 20.5})
+    assert bank.get_balance(a) == Decimal("15.00")
+    assert bank.get_balance(b) == Decimal("20.50")
+
+
+def test_bulk_deposit_is_all_or_nothing():
+    bank = BankingSystem()
+    a = bank.create_account("Dave", 10)
+    b = bank.create_account("Eve")
+    with pytest.raises(ValueError):
+        bank.bulk_deposit({a: 5, b: 0})
+    with pytest.raises(KeyError):
+        bank.bulk_deposit({a: 5, "missing": 1})
+    assert bank.get_balance(a) == Decimal("10.00")
+    assert bank.get_balance(b) == Decimal("0.00")
+
+
 def test_save_and_load(tmp_path: Path):
     csv_path = tmp_path / "accounts.csv"
 
@@ -58,6 +168,71 @@ def test_save_and_load(tmp_path: Path):
     assert reloaded.get_balance(bob) == Decimal("75.00")
 
 
+def test_load_shares_repeated_names(tmp_path: Path):
+    csv_path = tmp_path / "accounts.csv"
+
+    bank = BankingSystem()
+    a = bank.create_account("Family Trust")
+    b = bank.create_account("Family Trust")
+    bank.save_csv(csv_path)
+    reloaded = BankingSystem.load_csv(csv_path)
+
+    assert reloaded._accounts[a].name is reloaded._accounts[b].name
+
+
+def test_resave_keeps_quoted_names(tmp_path: Path):
+    csv_path = tmp_path / "accounts.csv"
+    # file written by the csv module, as older versions of save_csv did
+    with csv_path.open("w", newline="", encoding="utf-8") as f:
+        w = csv.writer(f)
+        w.writerow(("id", "name", "balance"))
+        w.writerow(("acc-1", "Smith, John", "5.00"))
+        w.writerow(("acc-2", 'The "Boss"', "7.50"))
+
+    bank = BankingSystem.load_csv(csv_path)
+    bank.save_csv(csv_path)
+    reloaded = BankingSystem.load_csv(csv_path)
+
+    assert reloaded._accounts["acc-1"].name == "Smith, John"
+    assert reloaded._accounts["acc-2"].name == 'The "Boss"'
+    assert reloaded.get_balance("acc-1") == Decimal("5.00")
+    assert reloaded.get_balance("acc-2") == Decimal("7.50")
+
+
+def test_save_and_load_name_with_comma(tmp_path: Path):
+    csv_path = tmp_path / "accounts.csv"
+
+    bank = BankingSystem()
+    acc = bank.create_account("Smith, John", 5)
+    bank.save_csv(csv_path)
+
+    assert BankingSystem.load_csv(csv_path)._accounts[acc].name == "Smith, John"
+
+
+def test_save_and_load_non_ascii_name(tmp_path: Path):
+    csv_path = tmp_path / "accounts.csv"
+
+    bank = BankingSystem()
+    acc = bank.create_account("José", 5)
+    bank.save_csv(csv_path)
+
+    assert "José".encode("utf-8") in csv_path.read_bytes()
+    assert BankingSystem.load_csv(csv_path)._accounts[acc].name == "José"
+
+
+def test_load_skips_blank_lines(tmp_path: Path):
+    csv_path = tmp_path / "accounts.csv"
+    csv_path.write_bytes(
+        b"id,name,balance\r\nacc-1,Alice,5.00\r\n\r\nacc-2,Bob,1.00\r\n\r\n"
+    )
+
+    bank = BankingSystem.load_csv(csv_path)
+
+    assert len(bank._accounts) == 2
+    assert bank.get_balance("acc-1") == Decimal("5.00")
+    assert bank.get_balance("acc-2") == Decimal("1.00")
+
+
 def test_save_creates_file(tmp_path: Path):
     """
     file should exist after save_csv.